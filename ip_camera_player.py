@@ -18,24 +18,52 @@ Version: 1.0.0
 
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QLabel, QPushButton,
                              QHBoxLayout, QVBoxLayout, QWidget, QFileDialog,
-                             QLineEdit, QDialog, QComboBox, QStatusBar, QMessageBox)
-from PyQt5.QtCore import (Qt, QThread, pyqtSignal, QPoint, QMutex, QMutexLocker,
-                          QSettings)
-from PyQt5.QtGui import (QImage, QPixmap, QCloseEvent, QIcon, QMovie,
-                         QWheelEvent, QMouseEvent)
+                             QLineEdit, QDialog, QComboBox, QStatusBar, QMessageBox,
+                             QSizePolicy)
+from PyQt5.QtCore import (Qt, QThread, pyqtSignal, QPoint,
+                          QSettings, QRectF, QTimer, QObject, QRunnable, QThreadPool, QEvent)
+from PyQt5.QtGui import (QImage, QCloseEvent, QIcon, QMovie,
+                         QWheelEvent, QMouseEvent, QPainter, QResizeEvent, QPaintEvent)
 
 import sys
 import cv2
 import time
 import numpy as np
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Callable, Optional
 import os
 from os import path
 from datetime import datetime
+from ast import literal_eval
 import threading
+import logging
+from collections import deque
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
 
 SW_VERSION = '1.0.0'
 CAMERA_OPENING_TIMEOUT_SECONDS = 20
+# Maximum time to wait for the stream thread to finish when stopping the stream
+STREAM_THREAD_STOP_TIMEOUT_MS = 2000
+# Video resolutions selectable in the camera settings, as (width, height)
+VIDEO_RESOLUTIONS = {'1080p': (1920, 1080), '720p': (1280, 720), '480p': (640, 480)}
+DEFAULT_VIDEO_RESOLUTION = VIDEO_RESOLUTIONS['1080p']
+# Directory of this module, where the images folder is located
+MODULE_DIR = os.path.dirname(os.path.realpath(__file__))
+# FFmpeg options used to open the stream: RTSP over TCP (no lost packets to conceal),
+# no input buffering for low latency and a socket timeout (in microseconds) so a camera
+# that does not answer cannot block forever. Can be overridden with the environment variable.
+FFMPEG_CAPTURE_OPTIONS = ('rtsp_transport;tcp|fflags;nobuffer|flags;low_delay|max_delay;500000'
+                          f'|stimeout;{CAMERA_OPENING_TIMEOUT_SECONDS * 1000000}')
+# Interval used to refresh the video display (~30 fps)
+DISPLAY_REFRESH_INTERVAL_MS = 33
+# Delay used to group the status bar updates
+STATUS_BAR_UPDATE_DELAY_MS = 100
+# Number of reusable frame buffers cycled between the stream thread and the UI
+FRAME_POOL_SIZE = 4
+# Number of bytes per pixel of the frames handed to the UI. Frames are converted to
+# BGRA, the memory layout of QImage.Format_RGB32 that Qt paints without conversion.
+FRAME_CHANNELS = 4
 
 
 # LoadingAnimation class to manage the GIF
@@ -57,7 +85,7 @@ class LoadingAnimation:
 
         Args:
             parent: Parent widget where the animation will be displayed
-            gif_path: Path to the GIF file
+            gif_path: Path to the GIF file, relative to the application directory
             size: Tuple of (width, height) for the animation size
         """
         self.parent = parent
@@ -68,7 +96,7 @@ class LoadingAnimation:
         self.label.setContentsMargins(0, 0, 0, 0)
 
         # Load the GIF using QMovie
-        file_name = os.path.dirname(os.path.realpath(__file__)) + gif_path
+        file_name = os.path.join(MODULE_DIR, gif_path)
         if path.exists(file_name):
             self.movie = QMovie(file_name)
 
@@ -96,22 +124,108 @@ class LoadingAnimation:
         self.label.hide()  # Hide the QLabel showing the GIF
 
 
+class VideoWidget(QWidget):
+    """
+    Widget that paints the video frames.
+
+    The frame is kept as a QImage sharing the memory of the decoded frame (no copy),
+    together with a reference to the array owning that memory. It is painted in
+    paintEvent, scaled from a source rectangle of the image into a target rectangle
+    of the widget. Changes only schedule a paint with update(), so Qt can merge
+    several requests into a single paint.
+    """
+
+    def __init__(self, parent=None) -> None:
+        """
+        Initialize the VideoWidget instance.
+
+        Args:
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        # Take all the space available in the layout
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # paintEvent paints every exposed pixel, Qt does not need to erase the background first
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+
+        # Class fields
+        self.__image = None
+        self.__image_buffer = None
+        self.__source_rect = QRectF()
+        self.__target_rect = QRectF()
+        # Kept as a Qt.GlobalColor, painted without creating a QColor
+        self.__fill_color = Qt.black
+
+    def set_image(self, image: QImage, image_buffer: np.ndarray,
+                  source_rect: QRectF, target_rect: QRectF) -> None:
+        """
+        Display an image, the rest of the widget is painted black.
+
+        Args:
+            image: Image to display
+            image_buffer: Array owning the image memory, kept alive while the image is displayed
+            source_rect: Area of the image to display
+            target_rect: Area of this widget where the source area is scaled into
+        """
+        self.__image = image
+        self.__image_buffer = image_buffer
+        self.__source_rect = source_rect
+        self.__target_rect = target_rect
+        self.__fill_color = Qt.black
+        self.update()
+
+    def clear(self, color: Qt.GlobalColor) -> None:
+        """
+        Remove the image and fill the whole widget with a solid color.
+        Nothing is repainted if the widget is already filled with that color.
+
+        Args:
+            color: Color to fill the widget with
+        """
+        if self.__image is None and self.__fill_color == color:
+            return
+        self.__image = None
+        self.__image_buffer = None
+        self.__fill_color = color
+        self.update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Paint the exposed region of the widget."""
+        exposed_rect = QRectF(event.rect())
+        painter = QPainter(self)
+        if self.__image is None or not self.__target_rect.contains(exposed_rect):
+            painter.fillRect(event.rect(), self.__fill_color)
+        if self.__image is not None:
+            # Blit only the exposed part of the target rectangle, from the matching
+            # part of the source rectangle (no smooth transformation, i.e. fast).
+            target_rect = self.__target_rect.intersected(exposed_rect)
+            if not target_rect.isEmpty():
+                scale_x = self.__source_rect.width() / self.__target_rect.width()
+                scale_y = self.__source_rect.height() / self.__target_rect.height()
+                source_rect = QRectF(
+                    self.__source_rect.x() + (target_rect.x() - self.__target_rect.x()) * scale_x,
+                    self.__source_rect.y() + (target_rect.y() - self.__target_rect.y()) * scale_y,
+                    target_rect.width() * scale_x,
+                    target_rect.height() * scale_y)
+                painter.drawImage(target_rect, self.__image, source_rect)
+        painter.end()
+
+
 class StreamThread(QThread):
     """
     Thread class for handling video stream capture.
 
     This class manages the camera connection and frame capture in a separate thread
-    to prevent UI blocking. It emits signals for frame updates and error conditions.
+    to prevent UI blocking. Captured frames are handed over through a callback and
+    signals are emitted for status updates and error conditions.
 
     Signals:
-        frame_received: Emitted when a new frame is captured
         first_frame_received: Emitted when the first frame is captured
         error_signal: Emitted when an error occurs
         status_signal: Emitted to update status messages
     """
 
-    # Signal use to send the frame to the main thread (ui)
-    frame_received = pyqtSignal(np.ndarray)
     # Signal used to notify that the first frame was received.
     first_frame_received = pyqtSignal()
     # Signal to send error messages to the UI thread.
@@ -119,100 +233,204 @@ class StreamThread(QThread):
     # Signal to send status messages to the UI thread.
     status_signal = pyqtSignal(str)
 
-    def __init__(self, url: str, video_res: Tuple[int, int] = (1920, 1080)) -> None:
+    def __init__(self, url: str, video_res: Tuple[int, int] = DEFAULT_VIDEO_RESOLUTION,
+                 frame_callback: Optional[Callable[[np.ndarray], None]] = None) -> None:
         """
         Initialize the StreamThread instance.
 
         Args:
             url: RTSP URL for the camera stream
             video_res: Desired video resolution as (width, height)
+            frame_callback: Called from this thread with every captured frame, ready to be
+                displayed (BGRA, see FRAME_CHANNELS). Frames are stored in a pool of
+                reusable buffers: the consumer gives each frame back with release_frame()
+                once it no longer uses it, and must copy it to keep it longer.
         """
         super().__init__()
 
         # Class fields
         self.__url = url
+        self.__frame_callback = frame_callback
         self.__cap = None
         self.__stream_is_running = False
         self.__stream_is_paused = False
         self.__video_resolution = video_res
         self.__first_frame_was_received = False
         self.__resize_frame = False
-        self.__timeout = CAMERA_OPENING_TIMEOUT_SECONDS
+        self.__interpolation = cv2.INTER_LINEAR
+        self.__raw_frame = None
+        self.__resized_frame = None
+        self.__free_frames = deque()
+        self.__pool_frame_ids = set()
+        self.__consumer_ready = threading.Event()
+        # Set while nothing is displayed (window minimized), frames are not even grabbed
+        self.__suspended = threading.Event()
 
     def run(self) -> None:
         """
        Main thread execution method for capturing video frames.
 
        This method handles the camera initialization and continuous frame capture.
-       It emits signals for frames and various status updates.
+       It hands frames to the frame callback and emits signals for status updates.
+       The camera is owned by this thread and released when the thread ends.
        """
-
-        # Start camera initialization in a separate thread
-        init_thread = threading.Thread(target=self.initialize_camera)
-        init_thread.start()
-
-        # Wait for the thread to complete or timeout
-        init_thread.join(self.__timeout)
-
-        # If the thread is still alive after the timeout, handle it as a failure
-        if init_thread.is_alive():
-            self.error_signal.emit("Failed to open camera stream: Operation timed out.")
-            self.stop_streaming()
-            return
-
-        # If camera initialization failed, stop the thread
+        try:
+            self.capture_frames()
+        finally:
+            self.__stream_is_running = False
+            # Release resources
+            if self.__cap is not None:
+                self.__cap.release()
+                self.__cap = None
+
+    def capture_frames(self) -> None:
+        """Open the camera and capture frames until the stream is stopped or an error occurs"""
+        # Open the camera, FFmpeg gives up by itself after the opening timeout
+        self.initialize_camera()
+
+        # If camera initialization failed (or timed out), stop the thread
         if not self.__cap or not self.__cap.isOpened():
             # self.error_signal.emit(f"Failed to open camera stream: {self.__url}")
             self.error_signal.emit(f"Failed to open camera stream")
-            self.stop_streaming()
             return
 
-        # Reduce buffer size for low latency
-        self.__cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # Get the desired frame width and height
+        desired_frame_width, desired_frame_height = self.__video_resolution
+        logger.info('requested camera resolution: %s', self.__video_resolution)
 
         # Get the stream width and height
-        frame_width = self.__cap.get(cv2.CAP_PROP_FRAME_WIDTH)
-        frame_height = self.__cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
-        print(f'camera resolution: {frame_width, frame_height}')
+        frame_width = int(self.__cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        frame_height = int(self.__cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        logger.info('camera resolution: %s', (frame_width, frame_height))
 
-        # Get the desired frame width and height
-        desired_frame_width, desired_frame_height = self.__video_resolution
-        print(f'requested camera resolution: {self.__video_resolution}')
+        # Frames are retrieved as BGR into a private buffer, then converted to BGRA into the pool buffers
+        self.__raw_frame = np.empty((frame_height, frame_width, 3), dtype=np.uint8)
 
         # Decide if we have to resize the frame
-        if desired_frame_width != frame_width or desired_frame_height != frame_height:
-            self.__resize_frame = True
-            print('Resizing frames')
+        self.__resize_frame = desired_frame_width != frame_width or desired_frame_height != frame_height
+        if self.__resize_frame:
+            # INTER_AREA gives the best quality when shrinking, INTER_LINEAR when enlarging
+            if desired_frame_width * desired_frame_height < frame_width * frame_height:
+                self.__interpolation = cv2.INTER_AREA
+            else:
+                self.__interpolation = cv2.INTER_LINEAR
+            # Resized into a second private buffer, before the conversion
+            self.__resized_frame = np.empty((desired_frame_height, desired_frame_width, 3), dtype=np.uint8)
+            pool_frame_shape = (desired_frame_height, desired_frame_width, FRAME_CHANNELS)
+            logger.info('Resizing frames')
+        else:
+            pool_frame_shape = (frame_height, frame_width, FRAME_CHANNELS)
+
+        # Preallocate the pool of buffers handed over to the consumer
+        pool = [np.empty(pool_frame_shape, dtype=np.uint8) for _ in range(FRAME_POOL_SIZE)]
+        self.__pool_frame_ids = {id(frame) for frame in pool}
+        self.__free_frames = deque(pool)
+
+        # Set when the suspension ends, the camera is then reopened before grabbing again
+        reopen_camera = False
 
         while self.__stream_is_running:
             if self.__cap and self.__cap.isOpened():
+                if self.__suspended.is_set():
+                    # Nothing reads the RTSP session while suspended, so no keepalive is
+                    # sent: the camera may drop it, and the frames it kept sending are stale.
+                    reopen_camera = True
+                    time.sleep(0.02)
+                    continue
+                if reopen_camera:
+                    reopen_camera = False
+                    if not self.reopen_camera():
+                        if self.__stream_is_running:
+                            self.error_signal.emit("Failed to reopen camera stream")
+                        break
                 if not self.__stream_is_paused:  # to pause the streaming
-                    # Read the camera frame and check for errors.
-                    ret, frame = self.__cap.read()
+                    # Grab and decode the next camera frame (not converted to BGR yet) and check for errors.
+                    if not self.__cap.grab():
+                        self.error_signal.emit("Error reading frame. Stopping the video stream.")
+                        break
+
+                    # Retrieve only when the consumer is ready for a new frame and a buffer
+                    # is free. The frames grabbed in the meantime are decoded by FFmpeg but
+                    # dropped before the BGR conversion, the copy, the resize and the BGRA
+                    # conversion (no buffer is ever allocated to keep up).
+                    if not self.__consumer_ready.is_set() or not self.__free_frames:
+                        continue
+                    self.__consumer_ready.clear()
+                    buffer = self.__free_frames.popleft()
+
+                    # Convert the grabbed frame to BGR into the preallocated buffer and check for errors.
+                    ret, frame = self.__cap.retrieve(self.__raw_frame)
                     if not ret:
                         self.error_signal.emit("Error reading frame. Stopping the video stream.")
                         break
 
                     # Resize frame for faster processing
                     if self.__resize_frame:
-                        frame = cv2.resize(frame, self.__video_resolution)
+                        frame = cv2.resize(frame, self.__video_resolution, dst=self.__resized_frame,
+                                           interpolation=self.__interpolation)
+
+                    # Convert to BGRA into the pool buffer, so that this work is done here
+                    # and the UI thread paints the frame without any conversion
+                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA, dst=buffer)
 
-                    # Emit a signal carrying the frame.
-                    self.frame_received.emit(frame)
+                    # If the frame did not fit (stream size changed) OpenCV allocated a
+                    # new array, the buffer was not used and goes back to the pool.
+                    if frame is not buffer:
+                        self.__free_frames.append(buffer)
+
+                    # Hand the frame over to the consumer.
+                    if self.__frame_callback:
+                        self.__frame_callback(frame)
 
                     # Notify when the first frame was received.
                     if not self.__first_frame_was_received:
                         self.status_signal.emit('Streaming started')
-                        # print('Streaming started')
                         self.first_frame_received.emit()
                         self.__first_frame_was_received = True
+                else:
+                    # Nothing is emitted while paused, sleep instead of busy-waiting
+                    time.sleep(0.02)
             else:
                 time.sleep(0.01)  # Sleep briefly to avoid busy-waiting
-        # self.stop_streaming()
+
+    def reopen_camera(self) -> bool:
+        """Release the camera and open it again, returns True if it was opened"""
+        self.status_signal.emit('Reopening camera stream')
+        self.__cap.release()
+        self.__cap = None
+        self.initialize_camera()
+        return self.__cap.isOpened()
 
     def initialize_camera(self):
-        """Camera initialization logic that runs in a separate thread"""
-        self.__cap = cv2.VideoCapture(self.__url)
+        """Camera initialization logic, blocks until the camera is opened or the opening times out"""
+        # The FFmpeg backend reads its options when the capture is opened
+        os.environ.setdefault('OPENCV_FFMPEG_CAPTURE_OPTIONS', FFMPEG_CAPTURE_OPTIONS)
+
+        # Open parameters supported by this OpenCV build (>= 4.5.2)
+        params = []
+        if hasattr(cv2, 'CAP_PROP_OPEN_TIMEOUT_MSEC'):
+            params += [cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, CAMERA_OPENING_TIMEOUT_SECONDS * 1000]
+        # Prefer hardware accelerated decoding, FFmpeg falls back to software
+        # decoding by itself when no accelerator is available.
+        if hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+            params += [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+
+        cap = None
+        if params:
+            try:
+                cap = cv2.VideoCapture(self.__url, cv2.CAP_FFMPEG, params)
+            except cv2.error as e:
+                logger.warning('Capture open parameters not supported: %s', e)
+        if cap is None:
+            cap = cv2.VideoCapture(self.__url, cv2.CAP_FFMPEG)
+
+        # Configure the capture before the first frame is read:
+        # reduce buffer size for low latency, and ask the camera for the desired
+        # resolution, so no resize is needed if it complies.
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.__video_resolution[0])
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.__video_resolution[1])
+        self.__cap = cap
 
     def start_streaming(self, url: str, res: Tuple[int, int]) -> None:
         if not self.__stream_is_running:
@@ -220,20 +438,21 @@ class StreamThread(QThread):
             self.__video_resolution = res
             self.__stream_is_running = True
             self.__stream_is_paused = False
+            self.__consumer_ready.set()
             self.start()  # Begins execution of the thread by calling run()
             self.status_signal.emit('Starting streaming')
         self.__first_frame_was_received = False
 
-    def stop_streaming(self) -> None:
+    def stop_streaming(self, timeout_ms: int = STREAM_THREAD_STOP_TIMEOUT_MS) -> bool:
+        """
+        Stop the capture loop and wait at most timeout_ms for the thread to finish.
+        The thread can take longer while the camera is opening. Returns True if it finished.
+        """
         self.status_signal.emit('Stopping streaming')
         self.__stream_is_running = False
         # Terminate the thread.
         self.quit()
-        self.wait()
-        # Release resources
-        if self.__cap is not None:
-            self.__cap.release()
-            self.__cap = None
+        return self.wait(timeout_ms)
 
     def pause_streaming(self, pause: bool) -> None:
         if pause:
@@ -243,6 +462,33 @@ class StreamThread(QThread):
             self.__stream_is_paused = False
             self.status_signal.emit('Streaming playing')
 
+    def suspend_streaming(self, suspend: bool) -> None:
+        """
+        Stop grabbing frames (and so decoding them) while nothing is displayed, or resume.
+        The camera is reopened when resuming. Unlike pause_streaming, no status is emitted
+        when suspending. Can be called from any thread.
+        """
+        if suspend:
+            self.__suspended.set()
+        else:
+            self.__suspended.clear()
+
+    def frame_consumed(self) -> None:
+        """
+        Notify that the last frame handed to the frame callback was consumed, so the
+        next grabbed frame can be retrieved. Can be called from any thread.
+        """
+        self.__consumer_ready.set()
+
+    def release_frame(self, frame: np.ndarray) -> None:
+        """
+        Give a frame handed to the frame callback back to the pool of buffers, once the
+        consumer does not use it anymore. Frames not coming from the pool are ignored.
+        Can be called from any thread.
+        """
+        if id(frame) in self.__pool_frame_ids:
+            self.__free_frames.append(frame)
+
     def set_url(self, url: str) -> None:
         self.__url = url
 
@@ -256,6 +502,51 @@ class StreamThread(QThread):
         return self.__video_resolution
 
 
+class SnapshotSaverSignals(QObject):
+    """
+    Signals of SnapshotSaver (a QRunnable is not a QObject and cannot emit signals).
+
+    Signals:
+        saved: Emitted with the file path when the snapshot was written
+        failed: Emitted with an error message when the snapshot could not be saved
+    """
+    saved = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class SnapshotSaver(QRunnable):
+    """
+    Encode a snapshot as PNG and write it to a file on a thread pool thread,
+    so the UI is not blocked while the image is compressed.
+    """
+    def __init__(self, snapshot: np.ndarray, file_path: Path) -> None:
+        """
+        Initialize the SnapshotSaver.
+
+        Args:
+            snapshot: BGR image to save, owned by the saver (not modified by anyone else)
+            file_path: Path of the PNG file to write
+        """
+        super().__init__()
+        self.__snapshot = snapshot
+        self.__file_path = file_path
+        # Created on the UI thread, so the signals are delivered to the UI thread
+        self.signals = SnapshotSaverSignals()
+
+    def run(self) -> None:
+        try:
+            # Encode in memory and write the file (also works with non-ASCII paths)
+            ret, buffer = cv2.imencode('.png', self.__snapshot)
+            if ret:
+                with open(self.__file_path, 'wb') as file:
+                    file.write(buffer.tobytes())
+                self.signals.saved.emit(str(self.__file_path))
+            else:
+                self.signals.failed.emit("Failed to save snapshot.")
+        except Exception as e:
+            self.signals.failed.emit(f"An error occurred while saving the snapshot: {e}")
+
+
 class CameraSettings(QDialog):
     """
     Dialog for configuring camera connection settings.
@@ -311,14 +602,10 @@ class CameraSettings(QDialog):
         self.stream_path_line_edit.setText(parent.stream_path)
 
         self.video_res_combo_box = QComboBox(self)
-        video_res = ['1080p', '720p', '480p']
-        self.video_res_combo_box.addItems(video_res)
-        if parent.video_resolution == (1920, 1080):
-            self.video_res_combo_box.setCurrentIndex(0)
-        elif parent.video_resolution == (1280, 720):
-            self.video_res_combo_box.setCurrentIndex(1)
-        elif parent.video_resolution == (640, 480):
-            self.video_res_combo_box.setCurrentIndex(2)
+        self.video_res_combo_box.addItems(list(VIDEO_RESOLUTIONS))
+        resolutions = list(VIDEO_RESOLUTIONS.values())
+        if parent.video_resolution in resolutions:
+            self.video_res_combo_box.setCurrentIndex(resolutions.index(parent.video_resolution))
         else:
             self.video_res_combo_box.setCurrentIndex(0)
 
@@ -417,8 +704,7 @@ class Windows(QMainWindow):
 
     Attributes:
         app_settings (QSettings): Application settings manager
-        mutex (QMutex): Mutex for thread synchronization
-        video_label (QLabel): Label for displaying video stream
+        video_widget (VideoWidget): Widget for displaying video stream
         current_frame (np.ndarray): Current video frame
         zoom_factor (float): Current zoom level
         is_full_screen (bool): Fullscreen state flag
@@ -431,9 +717,6 @@ class Windows(QMainWindow):
         # Create an instance of the QSettings class to persist application data.
         self.app_settings = QSettings('IP Camera Player', 'AppSettings')
 
-        # Create a mutex to access the shared resource (frame)
-        self.mutex = QMutex()
-
         # Create a label in the status bar to show status messages.
         self.status_bar_message_label = QLabel()
 
@@ -443,11 +726,17 @@ class Windows(QMainWindow):
         # Create a label in the status bar to show the camera resolution
         self.status_bar_resolution = QLabel()
 
-        # Create a label to display the video stream
-        self.video_label = QLabel(self)
-        self.video_label.setContentsMargins(0, 0, 0, 0)
-        self.video_label.setAlignment(Qt.AlignCenter)
-        self.video_label.setStyleSheet("background-color: black;")
+        # Texts waiting to be shown in the status bar labels, applied by a timer so
+        # rapid state changes only update the status bar once.
+        self._pending_status_texts: Dict[QLabel, str] = {}
+        self.status_bar_timer = QTimer(self)
+        self.status_bar_timer.setSingleShot(True)
+        self.status_bar_timer.setInterval(STATUS_BAR_UPDATE_DELAY_MS)
+        self.status_bar_timer.timeout.connect(self.apply_status_bar_texts)
+
+        # Create a widget to display the video stream
+        self.video_widget = VideoWidget(self)
+        self.video_widget.setContentsMargins(0, 0, 0, 0)
 
         # Create a button to start streaming video from the camera.
         self.start_button = QPushButton("Start", self)
@@ -475,6 +764,10 @@ class Windows(QMainWindow):
         self.open_cam_settings_button.setEnabled(True)
         self.open_cam_settings_button.clicked.connect(self.open_camera_settings)
 
+        # Widgets enabled and disabled together by enable_widgets()
+        self._toggleable = (self.open_cam_settings_button, self.start_button, self.pause_button,
+                            self.take_snapshot_button, self.stop_button)
+
         # Read camera persisted settings if existed.
         self.protocol: str = self.app_settings.value('protocol', 'rtsp', type=str)
         self.user: str = self.app_settings.value('user', '', type=str)
@@ -484,18 +777,32 @@ class Windows(QMainWindow):
         self.stream_path: str = self.app_settings.value('stream_path', '', type=str)
         # Retrieve the tuple as a string
         video_resolution_str = self.app_settings.value('video_resolution', '', type=str)
-        # Convert the string back to a tuple using eval
+        # Convert the string back to a tuple (literal only, no code is evaluated)
         if video_resolution_str:
-            self.video_resolution: Tuple[int, int] = eval(video_resolution_str)
+            self.video_resolution: Tuple[int, int] = literal_eval(video_resolution_str)
         else:
-            self.video_resolution: Tuple[int, int] = (1920, 1080)
+            self.video_resolution: Tuple[int, int] = DEFAULT_VIDEO_RESOLUTION
 
         # Variable for pausing
         self.is_running = False
 
-        # Store the current frame for snapshot functionality
+        # Store the current frame for snapshot functionality (only used on the UI thread)
         self.current_frame = None
 
+        # Latest frame received from the stream thread, waiting to be displayed.
+        # Single producer / single consumer slot: assigning an object reference is
+        # atomic in CPython, and the stream thread only stores a new frame after the
+        # previous one was taken (see StreamThread.frame_consumed), so no lock is needed.
+        self._latest_frame = None
+
+        # Qt images wrapping the stream thread's frame buffers, created once per buffer
+        self._frame_images: Dict[Tuple[int, Tuple[int, ...]], Tuple[np.ndarray, QImage]] = {}
+
+        # Timer that displays the latest frame on the UI thread
+        self.display_timer = QTimer(self)
+        self.display_timer.setInterval(DISPLAY_REFRESH_INTERVAL_MS)
+        self.display_timer.timeout.connect(self.update_display)
+
         # Store the zoom factor. Start with no zoom
         self.zoom_factor = 1.0
 
@@ -509,22 +816,36 @@ class Windows(QMainWindow):
         self.scaled_width = 0
         self.scaled_height = 0
 
+        # Size of the displayed frames and panning limits (updated with zoom and resize)
+        self._frame_size = (0, 0)
+        self._max_x_offset = 0
+        self._max_y_offset = 0
+
+        # Image currently displayed, redisplayed when the zoom or panning changes
+        self._displayed_image = None
+        # True while a redisplay for zoom/panning changes is scheduled
+        self._pending_update = False
+
         # Variable to track full screen state
         self.is_full_screen = False
 
+        # True while closing waits for the stream thread to finish
+        self._close_pending = False
+
         # Initialize the GUI.
         self.init_gui()
 
-        # variable to store the camera url
+        # variables to store the camera url and the url shown in the status bar
         self.url = ""
+        self.url_hidden_password = ""
+        # True when a camera setting changed and the urls must be rebuilt
+        self._url_dirty = True
 
         if self.ip:
             # Construct the url.
-            self.url = f"{self.protocol}://{self.user}:{self.password}@{self.ip}:{self.port}/{self.stream_path}"
+            self.update_camera_url()
             # Update the status bar
-            hidden_password = self.replace_letters_with_asterisks(self.password)
-            url_hidden_password = f" {self.protocol}://{self.user}:{hidden_password}@{self.ip}:{self.port}/{self.stream_path} "
-            self.update_status_bar('Streaming stopped', url_hidden_password, f'{self.video_resolution}')
+            self.update_status_bar('Streaming stopped', self.url_hidden_password, f'{self.video_resolution}')
             # Enable the start button
             self.start_button.setEnabled(True)
         else:
@@ -535,16 +856,15 @@ class Windows(QMainWindow):
 
             # Create the loading animation
         self.loading_animation = LoadingAnimation(self,
-                                                  "\\images\\Spinner-1s-104px.gif",
+                                                  os.path.join('images', 'Spinner-1s-104px.gif'),
                                                   (104, 104))
 
         # Create an instance of the RTSPCameraStream class.
-        self.rtspCameraStream = StreamThread(self.url, self.video_resolution)
+        self.rtspCameraStream = StreamThread(self.url, self.video_resolution, self.store_latest_frame)
         self.rtspCameraStream.first_frame_received.connect(self.setup_widgets_when_playing)
-        self.rtspCameraStream.frame_received.connect(self.display_frame)
         self.rtspCameraStream.finished.connect(self.setup_widgets_when_stopped)
-        self.rtspCameraStream.error_signal.connect(lambda error: self.error_streaming(error))
-        self.rtspCameraStream.status_signal.connect(lambda status: self.streaming_status(status))
+        self.rtspCameraStream.error_signal.connect(self.error_streaming)
+        self.rtspCameraStream.status_signal.connect(self.streaming_status)
 
     def init_gui(self) -> None:
         """Initialize and set up the graphical user interface."""
@@ -565,7 +885,7 @@ class Windows(QMainWindow):
 
         # Create a Vertical layout
         layout_vertical_1 = QVBoxLayout()
-        layout_vertical_1.addWidget(self.video_label)
+        layout_vertical_1.addWidget(self.video_widget)
         layout_vertical_1.addLayout(layout_horizontal_1)
 
         #
@@ -579,7 +899,7 @@ class Windows(QMainWindow):
         self.setCentralWidget(container_widget)
         self.setMinimumSize(720, 720)  # self.setMinimumSize(1280, 720)
         self.setWindowTitle("IP Camera Player")
-        file_name = os.path.dirname(os.path.realpath(__file__)) + "\\images\\Security-Camera-icon.png"
+        file_name = os.path.join(MODULE_DIR, 'images', 'Security-Camera-icon.png')
         if path.exists(file_name):
             self.setWindowIcon(QIcon(file_name))
         self.setStatusBar(self.create_status_bar())
@@ -610,7 +930,8 @@ class Windows(QMainWindow):
 
     def update_status_bar(self, message: str, url: str, res: str) -> None:
         """
-        Update the status bar with new information.
+        Update the status bar with new information. The changes are shown after
+        STATUS_BAR_UPDATE_DELAY_MS, grouped with any other update made meanwhile.
 
         Args:
             message: Status message to display
@@ -618,16 +939,30 @@ class Windows(QMainWindow):
             res: Resolution information to display
         """
         if message:
-            self.status_bar_message_label.setText(f'Status: {message},')
+            self._pending_status_texts[self.status_bar_message_label] = f'Status: {message},'
         if url:
-            self.status_bar_url.setText(f'Url: {url},')
+            self._pending_status_texts[self.status_bar_url] = f'Url: {url},'
         if res:
-            self.status_bar_resolution.setText(f'Resolution: {res}')
+            self._pending_status_texts[self.status_bar_resolution] = f'Resolution: {res}'
+        if self._pending_status_texts and not self.status_bar_timer.isActive():
+            self.status_bar_timer.start()
 
-    @staticmethod
-    def replace_letters_with_asterisks(input_string: str) -> str:
-        # Replace each letter with '*', keeping non-letters intact
-        return ''.join('*' for char in input_string)
+    def apply_status_bar_texts(self) -> None:
+        """Show the pending texts in the status bar."""
+        for label, text in self._pending_status_texts.items():
+            label.setText(text)
+        self._pending_status_texts.clear()
+
+    def update_camera_url(self) -> None:
+        """
+        Rebuild the camera url and the url with the password hidden, if a camera setting changed.
+        """
+        if not self._url_dirty:
+            return
+        address = f"{self.ip}:{self.port}/{self.stream_path}"
+        self.url = f"{self.protocol}://{self.user}:{self.password}@{address}"
+        self.url_hidden_password = f" {self.protocol}://{self.user}:{'*' * len(self.password)}@{address} "
+        self._url_dirty = False
 
     def start_streaming(self) -> None:
         if self.rtspCameraStream and not self.rtspCameraStream.isRunning() and self.ip:
@@ -639,52 +974,175 @@ class Windows(QMainWindow):
             self.y_offset = 0
             self.scaled_width = 0
             self.scaled_height = 0
+            self._frame_size = (0, 0)
+            self._max_x_offset = 0
+            self._max_y_offset = 0
+            self._latest_frame = None
+            self._frame_images.clear()
             # Set up the widgets.
             self.setup_widgets_when_starting()
             # start streaming the camera
             self.rtspCameraStream.start_streaming(self.url, self.video_resolution)
+            self.display_timer.start()
             # update this flag
             self.is_running = True
 
+    def store_latest_frame(self, frame: np.ndarray) -> None:
+        """
+        Store the newest frame captured by the stream thread. Called from the stream thread.
+        """
+        self._latest_frame = frame
+
+    def update_display(self) -> None:
+        """Display the latest frame, if a new one arrived since the last refresh."""
+        # While nothing is visible the frame is left pending, so the stream thread
+        # keeps dropping the new frames before converting them.
+        if not self.video_is_visible():
+            return
+        frame = self._latest_frame
+        if frame is not None:
+            self._latest_frame = None
+            self.display_frame(frame)
+            # Ready for the next frame
+            self.rtspCameraStream.frame_consumed()
+
+    def video_is_visible(self) -> bool:
+        """Return True if at least part of the video widget is visible on screen."""
+        return (self.isVisible() and not self.isMinimized()
+                and not self.video_widget.visibleRegion().isEmpty())
+
+    def frame_to_qimage(self, frame: np.ndarray) -> Tuple[QImage, np.ndarray]:
+        """
+        Return a QImage sharing the memory of the given frame, and the array
+        owning that memory (which must be kept alive as long as the image is used).
+
+        The stream thread writes the frames into a few reused buffers, so the QImage created
+        for a buffer is cached and reused for every frame written into it.
+        """
+        key = (frame.ctypes.data, frame.shape)
+        cached = self._frame_images.get(key)
+        if cached is None:
+            # Drop stale entries if the stream thread had to allocate new buffers
+            if len(self._frame_images) >= 2 * FRAME_POOL_SIZE:
+                self._frame_images.clear()
+            h, w = frame.shape[:2]
+            # The cache keeps a reference to the frame, so the buffer outlives its image
+            cached = (frame, QImage(frame.data, w, h, frame.strides[0], QImage.Format_RGB32))
+            self._frame_images[key] = cached
+        return cached[1], cached[0]
+
     def display_frame(self, frame: np.ndarray) -> None:
-        if self.rtspCameraStream:
-            # Store the frame for snapshot and zoom functionality
-            self.current_frame = frame
-            # Convert the frame to RGB format.
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            # Extract the height, width, and the number of channels.
-            h, w, ch = frame.shape
-            # Calculate bytes per line
-            bytes_per_line = ch * w
-            # Create an image in Qt format using the given frame.
-            q_image = QImage(frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            # Create a pixmap from image.
-            pixmap = QPixmap.fromImage(q_image)
-
-            # Apply zoom factor to the pixmap, converting dimensions to integers
-            self.scaled_width = int(self.zoom_factor * w)
-            self.scaled_height = int(self.zoom_factor * h)
-
-            # Scale the pixmap with integer dimensions and keep the aspect ratio
-            scaled_pixmap = pixmap.scaled(self.scaled_width, self.scaled_height, Qt.KeepAspectRatio)
-
-            # Enforce boundary limits for panning (do not pan outside the image)
-            self.x_offset = max(0, min(self.x_offset, self.scaled_width - self.video_label.width()))
-            self.y_offset = max(0, min(self.y_offset, self.scaled_height - self.video_label.height()))
-
-            # Create a sub-area based on panning
-            visible_pixmap = scaled_pixmap.copy(self.x_offset, self.y_offset, self.video_label.width(),
-                                                self.video_label.height())
-
-            # Display the frame
-            self.video_label.setPixmap(visible_pixmap)
-
-    def stop_streaming(self) -> None:
+        previous_frame = self.current_frame
+        previous_image = self._displayed_image
+
+        # Store the frame for snapshot and zoom functionality.
+        self.current_frame = frame
+
+        # Skip all the display work when the stream is paused or nothing is visible
+        if self.is_running and self.video_is_visible():
+            # Extract the height and width.
+            h, w = frame.shape[:2]
+            # Qt image sharing the frame memory (no color conversion in the UI thread).
+            q_image, image_buffer = self.frame_to_qimage(frame)
+            # Update the zoomed size and panning limits if the frame size changed
+            if (w, h) != self._frame_size:
+                self._frame_size = (w, h)
+                self.update_pan_limits()
+
+            # Display the frame with the current zoom and panning
+            self._displayed_image = (q_image, image_buffer)
+            self.show_image(q_image, image_buffer)
+
+        # Give the buffers that are not used anymore back to the stream thread
+        self.release_unused_frames(previous_frame, previous_image[1] if previous_image else None)
+
+    def release_unused_frames(self, *frames: Optional[np.ndarray]) -> None:
+        """
+        Give frames back to the stream thread's buffer pool, unless they are still
+        used as the current frame or as the displayed image.
+        """
+        displayed_buffer = self._displayed_image[1] if self._displayed_image else None
+        released = []
+        for frame in frames:
+            if (frame is None or frame is self.current_frame or frame is displayed_buffer
+                    or any(frame is other for other in released)):
+                continue
+            released.append(frame)
+            self.rtspCameraStream.release_frame(frame)
+
+    def show_image(self, q_image: QImage, image_buffer: np.ndarray) -> None:
+        """
+        Display an image in the video widget with the current zoom and panning applied.
+
+        Args:
+            q_image: Image of the frame
+            image_buffer: Array owning the image memory
+        """
+        # Enforce boundary limits for panning (do not pan outside the image)
+        widget_width = self.video_widget.width()
+        widget_height = self.video_widget.height()
+        self.x_offset = 0 if self._max_x_offset <= 0 else min(max(self.x_offset, 0), self._max_x_offset)
+        self.y_offset = 0 if self._max_y_offset <= 0 else min(max(self.y_offset, 0), self._max_y_offset)
+
+        # Size of the visible sub-area of the zoomed frame
+        visible_width = min(widget_width, self.scaled_width - self.x_offset)
+        visible_height = min(widget_height, self.scaled_height - self.y_offset)
+        if visible_width <= 0 or visible_height <= 0:
+            return
+
+        # Map the visible sub-area back to the original frame, so only the
+        # pixels that end up on screen are scaled (independent of the zoom).
+        # With no zoom both rectangles have the same size and Qt blits without scaling.
+        source_rect = QRectF(self.x_offset / self.zoom_factor, self.y_offset / self.zoom_factor,
+                             visible_width / self.zoom_factor, visible_height / self.zoom_factor)
+
+        # Center the visible sub-area in the video widget
+        target_rect = QRectF((widget_width - visible_width) // 2, (widget_height - visible_height) // 2,
+                             visible_width, visible_height)
+
+        # The image is painted by the widget on its next paint event
+        self.video_widget.set_image(q_image, image_buffer, source_rect, target_rect)
+
+    def schedule_view_update(self) -> None:
+        """
+        Schedule a single redisplay after a zoom or panning change. All the changes
+        received before the event loop gets control again are applied at once.
+        """
+        if not self._pending_update:
+            self._pending_update = True
+            QTimer.singleShot(0, self._flush_update)
+
+    def _flush_update(self) -> None:
+        """Apply the pending zoom and panning changes to the displayed image."""
+        self._pending_update = False
+        self.update_pan_limits()
+        if self._displayed_image is not None:
+            self.show_image(*self._displayed_image)
+
+    def update_pan_limits(self) -> None:
+        """
+        Update the zoomed frame size and the panning limits.
+        Must be called whenever the zoom factor, the frame size or the video widget size changes.
+        """
+        # Apply zoom factor to the frame size, converting dimensions to integers
+        w, h = self._frame_size
+        self.scaled_width = int(self.zoom_factor * w)
+        self.scaled_height = int(self.zoom_factor * h)
+        self._max_x_offset = max(0, self.scaled_width - self.video_widget.width())
+        self._max_y_offset = max(0, self.scaled_height - self.video_widget.height())
+
+    def stop_streaming(self) -> bool:
+        """
+        Stop the stream thread. Returns False if it is still running after the bounded
+        wait (i.e. still opening the camera), it finishes later by itself.
+        """
+        stopped = True
         # if self.rtspCameraStream and self.rtspCameraStream.is_running:
         if self.rtspCameraStream and self.rtspCameraStream.isRunning():
-            self.rtspCameraStream.stop_streaming()
+            stopped = self.rtspCameraStream.stop_streaming()
             self.is_running = False
             self.start_button.setFocus()
+        return stopped
 
     def pause_streaming(self) -> None:
         if self.rtspCameraStream and self.rtspCameraStream.isRunning():
@@ -704,67 +1162,47 @@ class Windows(QMainWindow):
                               QMessageBox.Critical)
 
         self.update_status_bar(error, "", "")
-        print(error)
+        logger.error('%s', error)
 
     def streaming_status(self, status: str) -> None:
         self.update_status_bar(status, "", "")
-        print(status)
+        logger.info('%s', status)
 
     def reset_video_label(self: 'Windows') -> None:
         """
-        Reset the video label to a solid black background after clearing the video frame.
+        Reset the video widget to a solid black background after clearing the video frame.
         """
-        # Clear any existing pixmap
-        self.video_label.clear()
-
-        # Create a black QPixmap with the same size as the video label
-        black_pixmap = QPixmap(self.video_label.size())
-        black_pixmap.fill(Qt.black)
-
-        # Set the black pixmap as the label's content
-        self.video_label.setPixmap(black_pixmap)
-
-        # Ensure the UI is updated immediately
-        self.video_label.repaint()
+        previous_image = self._displayed_image
+        self._displayed_image = None
+        self.video_widget.clear(Qt.black)
+        if previous_image:
+            self.release_unused_frames(previous_image[1])
 
     def set_video_label_to_gray(self: 'Windows') -> None:
         """
-        Set the video label to a solid gray background after clearing the video frame.
+        Set the video widget to a solid gray background after clearing the video frame.
         """
-        # Clear any existing pixmap
-        self.video_label.clear()
-
-        # Create a black QPixmap with the same size as the video label
-        black_pixmap = QPixmap(self.video_label.size())
-        black_pixmap.fill(Qt.lightGray)
-
-        # Set the black pixmap as the label's content
-        self.video_label.setPixmap(black_pixmap)
-
-        # Ensure the UI is updated immediately
-        self.video_label.repaint()
+        previous_image = self._displayed_image
+        self._displayed_image = None
+        self.video_widget.clear(Qt.lightGray)
+        if previous_image:
+            self.release_unused_frames(previous_image[1])
 
     def enable_widgets(self, enable: bool) -> None:
         """
-        Enable or disable all child widgets of a QMainWindow.
+        Enable or disable all the control widgets of the main window.
 
-        This function iterates through all child widgets of the specified QMainWindow
-        and sets their enabled state according to the 'enabled' parameter.
+        This function iterates through the control buttons (fixed at construction)
+        and sets their enabled state according to the 'enable' parameter.
 
         Parameters:
-        - enabled: bool. The state to set for the child widgets (True to enable, False to disable).
+        - enable: bool. The state to set for the widgets (True to enable, False to disable).
 
         Returns:
         None
         """
-        for widget in self.findChildren(QWidget):
-            if isinstance(widget, QWidget):  # Ensure it's a QWidget
-                if enable:
-                    widget.setEnabled(True)
-                else:
-                    widget.setEnabled(False)
-        # Ensure the UI is updated immediately
-        self.video_label.repaint()
+        for widget in self._toggleable:
+            widget.setEnabled(enable)
 
     def setup_widgets_when_starting(self) -> None:
         # self.enable_widgets(False)  # disable all the widgets
@@ -776,7 +1214,7 @@ class Windows(QMainWindow):
         self.take_snapshot_button.setEnabled(False)
         self.stop_button.setEnabled(True)
         self.pause_button.setText("Pause")
-        print("Loading camera stream, please wait...")
+        logger.info("Loading camera stream, please wait...")
         self.update_status_bar("Loading stream", "", "")
 
     def setup_widgets_when_playing(self) -> None:
@@ -788,11 +1226,12 @@ class Windows(QMainWindow):
         self.take_snapshot_button.setEnabled(True)
         self.stop_button.setEnabled(True)
         self.stop_button.setFocus()
-        print("Streaming running")
+        logger.info("Streaming running")
         self.update_status_bar("Streaming running", "", "")
 
     def setup_widgets_when_stopped(self) -> None:
         # self.enable_widgets(True)
+        self.display_timer.stop()
         self.loading_animation.stop()  # stop the loading animation
         self.reset_video_label()
         self.open_cam_settings_button.setEnabled(True)
@@ -802,78 +1241,27 @@ class Windows(QMainWindow):
         self.stop_button.setEnabled(False)
         self.pause_button.setText("Pause")
         self.start_button.setFocus()
-        print("Streaming has stopped")
+        logger.info("Streaming has stopped")
         self.update_status_bar("Streaming stopped", "", "")
-
-    def take_snapshot_old_ok(self) -> None:
-        """
-        Take a snapshot of the current frame and save it to a file.
-        The user will input a custom file name, and the code will concatenate the current date and time.
-        """
-
-        # QMutexLocker automatically locks and unlocks the mutex
-        # to access the shared resource (self.current_frame)
-        # locker = QMutexLocker(self.mutex)
-        QMutexLocker(self.mutex)
-
-        try:
-            if self.current_frame is not None:
-                # Get the current date and time in the format MM/DD/YYYY and 12-hour time with AM/PM
-                current_time = datetime.now().strftime("%m-%d-%Y_%I-%M-%S%p")
-
-                # Prompt the user for a file name without extension
-                options = QFileDialog.Options()
-                file_path, _ = QFileDialog.getSaveFileName(self, "Save Snapshot", "",
-                                                           "Images (*.png *.jpg *.jpeg);;All Files (*)",
-                                                           options=options)
-
-                if file_path:
-                    # Extract the base name and the directory from the file path
-                    base_name = os.path.splitext(os.path.basename(file_path))[0]
-                    save_dir = os.path.dirname(file_path)
-
-                    # Concatenate the user-provided name with the current date and time
-                    final_file_name = f"{base_name}_{current_time}.png"
-                    final_path = os.path.join(save_dir, final_file_name)
-
-                    # Save the current frame to the selected file path
-                    cv2.imwrite(final_path, self.current_frame)
-                    print(f"Snapshot saved to {final_path}")
-
-                else:
-                    print("Save operation was canceled.")
-            else:
-                print("No frame available for snapshot")
-
-        finally:
-            # No need to manually unlock the mutex as QMutexLocker will do this automatically
-            pass
+        # Finish closing the window, if closing was waiting for the stream thread
+        if self._close_pending:
+            self.close()
 
     def take_snapshot(self) -> None:
         """
         Take a snapshot of the current visible portion of the frame (with zoom and panning applied)
         and save it to a file. The user will input a custom file name, and the code will concatenate
-        the current date and time.
+        the current date and time. The visible portion is saved at the frame resolution.
         """
 
-        # pixmap = None
+        frame = self.current_frame
 
-        # QMutexLocker automatically locks and unlocks the mutex
-        # to access the shared resource (self.video_label)
+        # Copy the visible area before prompting the user, the frame buffer is
+        # reused by the stream thread once newer frames are displayed
+        snapshot = self.copy_visible_frame_area(frame)
 
-        try:
-            with QMutexLocker(self.mutex):
-                # Ensure there is a pixmap in the QLabel before trying to save
-                pixmap = self.video_label.pixmap()
-        finally:
-            # No need to manually unlock the mutex as QMutexLocker will do this automatically
-            pass
-
-        if pixmap is not None and not pixmap.isNull():
+        if snapshot is not None and snapshot.size:
             try:
-                # Get the currently visible pixmap (with zoom and panning applied)
-                visible_pixmap = pixmap.copy()
-
                 # Get the current date and time in the format MM/DD/YYYY and 12-hour time with AM/PM
                 current_time = datetime.now().strftime("%m-%d-%Y_%I-%M-%S%p")
 
@@ -884,61 +1272,76 @@ class Windows(QMainWindow):
                                                            options=options)
 
                 if file_path:
-                    # Extract the base name and the directory from the file path
-                    base_name = os.path.splitext(os.path.basename(file_path))[0]
-                    save_dir = os.path.dirname(file_path)
-
-                    # Concatenate the user-provided name with the current date and time
-                    final_file_name = f"{base_name}_{current_time}.png"
-                    final_path = os.path.join(save_dir, final_file_name)
-
-                    # Save the visible pixmap to the selected file path
-                    if visible_pixmap.save(final_path, 'PNG'):
-                        print(f"Snapshot saved to {final_path}")
-                    else:
-                        print("Failed to save snapshot.")
+                    # Concatenate the user-provided name (without extension) with the current date and time
+                    chosen_path = Path(file_path)
+                    final_path = chosen_path.with_name(f"{chosen_path.stem}_{current_time}.png")
+
+                    # Encode and write the snapshot copy in the background
+                    saver = SnapshotSaver(snapshot, final_path)
+                    saver.signals.saved.connect(self.snapshot_saved)
+                    saver.signals.failed.connect(self.snapshot_failed)
+                    QThreadPool.globalInstance().start(saver)
                 else:
-                    print("Save operation was canceled.")
+                    logger.info("Save operation was canceled.")
             except Exception as e:
-                print(f"An error occurred while saving the snapshot: {e}")
+                logger.error("An error occurred while saving the snapshot: %s", e)
         else:
-            print("No visible pixmap available for snapshot.")
+            logger.warning("No visible frame available for snapshot.")
+
+    def snapshot_saved(self, file_path: str) -> None:
+        self.update_status_bar(f"Snapshot saved to {file_path}", "", "")
+        logger.info("Snapshot saved to %s", file_path)
+
+    def snapshot_failed(self, error: str) -> None:
+        self.update_status_bar(error, "", "")
+        logger.error('%s', error)
+
+    def copy_visible_frame_area(self, frame: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """
+        Return a BGR copy of the area of the (BGRA) frame that is visible in the video
+        widget (with zoom and panning applied), or None if there is no frame or visible area.
+        """
+        if frame is None:
+            return None
+        h, w = frame.shape[:2]
+        # Visible sub-area of the zoomed frame, mapped back to the frame coordinates
+        visible_width = min(self.video_widget.width(), int(self.zoom_factor * w) - self.x_offset)
+        visible_height = min(self.video_widget.height(), int(self.zoom_factor * h) - self.y_offset)
+        x = int(self.x_offset / self.zoom_factor)
+        y = int(self.y_offset / self.zoom_factor)
+        width = max(0, round(visible_width / self.zoom_factor))
+        height = max(0, round(visible_height / self.zoom_factor))
+        visible_area = frame[y:y + height, x:x + width]
+        if not visible_area.size:
+            return None
+        # The conversion drops the alpha channel and copies the area in a single pass
+        return cv2.cvtColor(visible_area, cv2.COLOR_BGRA2BGR)
 
     def open_camera_settings(self) -> None:
         # Create an instance of the CameraSettings class to enter the camera settings.
         camera_settings = CameraSettings(self)
-        camera_settings.camera_settings_closed.connect(lambda settings: self.update_camera_settings(settings))
-        camera_settings.camera_settings_start.connect(lambda settings: self.start_from_camera_settings(settings))
+        camera_settings.camera_settings_closed.connect(self.update_camera_settings)
+        camera_settings.camera_settings_start.connect(self.start_from_camera_settings)
         camera_settings.exec_()  # show the camera settings dialog
 
     def update_camera_settings(self, camera_settings: dict) -> None:
         if camera_settings:  # if the dict is not empty
-            # Update the camera settings
-            self.protocol = camera_settings['Protocol']
-            self.user = camera_settings['User Name']
-            self.password = camera_settings['Password']
-            self.ip = camera_settings['IP Address']
-            self.port = int(camera_settings['Port Number'])
-            self.stream_path = camera_settings['Stream Path']
-            if camera_settings['Video Resolution'] == '1080p':
-                self.video_resolution = (1920, 1080)
-            elif camera_settings['Video Resolution'] == '720p':
-                self.video_resolution = (1280, 720)
-            elif camera_settings['Video Resolution'] == '480p':
-                self.video_resolution = (640, 480)
-            else:
-                self.video_resolution = (1920, 1080)
+            # Update the camera settings, the urls are rebuilt only if one of them changed
+            url_fields = (camera_settings['Protocol'], camera_settings['User Name'],
+                          camera_settings['Password'], camera_settings['IP Address'],
+                          int(camera_settings['Port Number']), camera_settings['Stream Path'])
+            if url_fields != (self.protocol, self.user, self.password, self.ip, self.port, self.stream_path):
+                self.protocol, self.user, self.password, self.ip, self.port, self.stream_path = url_fields
+                self._url_dirty = True
+            self.video_resolution = VIDEO_RESOLUTIONS.get(camera_settings['Video Resolution'],
+                                                          DEFAULT_VIDEO_RESOLUTION)
 
             if self.ip:
                 # Update the url.
-                self.url = f"{self.protocol}://{self.user}:{self.password}@{self.ip}:{self.port}/{self.stream_path}"
-
-                # Hide the password
-                hidden_password = self.replace_letters_with_asterisks(self.password)
+                self.update_camera_url()
 
                 # Update the url and the camera resolution in the status bar
-                url_hidden_password = f' {self.protocol}://{self.user}:{hidden_password}@{self.ip}:{self.port}/{self.stream_path}'
-                self.update_status_bar("", url_hidden_password, f'{self.video_resolution}')
+                self.update_status_bar("", self.url_hidden_password, f'{self.video_resolution}')
 
                 self.start_button.setEnabled(True)
             else:
@@ -975,15 +1378,19 @@ class Windows(QMainWindow):
             pass
 
     def save_app_settings(self) -> None:
-        # Save and persist the camera settings for next time
-        self.app_settings.setValue('protocol', self.protocol)
-        self.app_settings.setValue('user', self.user)
-        self.app_settings.setValue('password', self.password)
-        self.app_settings.setValue('ip', self.ip)
-        self.app_settings.setValue('port', self.port)
-        self.app_settings.setValue('stream_path', self.stream_path)
-        # Convert tuple to string and persist it
-        self.app_settings.setValue('video_resolution', str(self.video_resolution))
+        # Save and persist the camera settings for next time (same keys as before,
+        # the resolution tuple is persisted as a string)
+        settings = {'protocol': self.protocol,
+                    'user': self.user,
+                    'password': self.password,
+                    'ip': self.ip,
+                    'port': self.port,
+                    'stream_path': self.stream_path,
+                    'video_resolution': str(self.video_resolution)}
+        for key, value in settings.items():
+            self.app_settings.setValue(key, value)
+        # setValue only updates QSettings' in-memory cache, write everything to storage at once
+        self.app_settings.sync()
 
     def wheelEvent(self, event: QWheelEvent) -> None:
         """
@@ -997,6 +1404,31 @@ class Windows(QMainWindow):
 
         # Ensure zoom factor stays within a reasonable range
         self.zoom_factor = max(0.1, min(self.zoom_factor, 10))
+        self.schedule_view_update()
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """
+        Update the panning limits and the displayed image when the window
+        (and so the video widget) is resized.
+        """
+        super().resizeEvent(event)
+        self.update_pan_limits()
+        self.schedule_view_update()
+
+    def changeEvent(self, event: QEvent) -> None:
+        """
+        Suspend the stream thread and the display refresh while the window is minimized,
+        and resume them when the window is restored.
+        """
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.display_timer.stop()
+                self.rtspCameraStream.suspend_streaming(True)
+            else:
+                self.rtspCameraStream.suspend_streaming(False)
+                if self.rtspCameraStream.isRunning() and not self.display_timer.isActive():
+                    self.display_timer.start()
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """
@@ -1014,9 +1446,12 @@ class Windows(QMainWindow):
             delta = event.pos() - self.last_mouse_position
             self.last_mouse_position = event.pos()
 
-            # Update the offset for panning
-            self.x_offset = max(0, min(self.x_offset - delta.x(), self.scaled_width - self.video_label.width()))
-            self.y_offset = max(0, min(self.y_offset - delta.y(), self.scaled_height - self.video_label.height()))
+            # Update the offset for panning, within the cached panning limits
+            x = self.x_offset - delta.x()
+            y = self.y_offset - delta.y()
+            self.x_offset = 0 if x < 0 else (self._max_x_offset if x > self._max_x_offset else x)
+            self.y_offset = 0 if y < 0 else (self._max_y_offset if y > self._max_y_offset else y)
+            self.schedule_view_update()
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         """
@@ -1035,7 +1470,18 @@ class Windows(QMainWindow):
         self.is_full_screen = not self.is_full_screen  # Toggle the state
 
     def closeEvent(self, event: QCloseEvent) -> None:
-        self.stop_streaming()
+        # Stop the stream thread and wait for it before saving the settings.
+        # The flag is set before the wait, so setup_widgets_when_stopped (connected to the
+        # thread's finished signal) closes the window if the thread finishes after the wait.
+        self._close_pending = True
+        if not self.stop_streaming():
+            # Still opening the camera, FFmpeg gives up by itself after the opening timeout.
+            # Destroying a running QThread aborts, so close again once the thread has finished.
+            logger.warning("Waiting for the camera opening to time out")
+            self.hide()
+            event.ignore()
+            return
+        self._close_pending = False
         if self.loading_animation:
             self.loading_animation.stop()
         if self.app_settings:
@@ -1045,6 +1491,7 @@ class Windows(QMainWindow):
 
 def main() -> None:
     """Main entry point for the application."""
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s %(levelname)s %(message)s')
     app = QApplication(sys.argv)
     window = Windows()
     window.show()